@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
+from pandas.api.types import union_categoricals
 
 from connectors import DataConnector
 from dashboard_builder import TeamTargets, deal_profitability, monthly_billing, team_scorecard, time_recorded_per_team, yearly_billing
@@ -10,63 +13,115 @@ st.set_page_config(page_title="Auto Analytics Dashboard", layout="wide")
 st.title("Auto Analytics & Reporting Dashboard")
 st.caption("Integrated view from monday.com, Harvest, and Xero. Uses demo data if credentials are missing.")
 
-connector = DataConnector()
-data = connector.load_data()
+
+@st.cache_data(ttl=3600, show_spinner="Loading data...")
+def load_all() -> dict[str, pd.DataFrame]:
+    # Materialise lazily built frames so the cached (pickled) result holds the data itself.
+    return dict(DataConnector().load_data())
+
+
+@st.cache_data(ttl=3600)
+def build_reports(
+    deals: pd.DataFrame, time_entries: pd.DataFrame, invoices: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    return monthly_billing(invoices), yearly_billing(invoices), time_recorded_per_team(time_entries), deal_profitability(deals)
+
+
+@st.cache_data(ttl=3600)
+def build_scorecard(
+    deals: pd.DataFrame,
+    time_entries: pd.DataFrame,
+    invoices: pd.DataFrame,
+    target_values: tuple[tuple[str, float, float, float, float], ...],
+) -> pd.DataFrame:
+    targets = {team: TeamTargets(*values) for team, *values in target_values}
+    return team_scorecard(deals, time_entries, invoices, targets)
+
+
+@st.cache_resource(max_entries=8)
+def make_billing_bar(billing: pd.DataFrame, period: str) -> go.Figure:
+    return px.bar(billing, x=period, y=["total_billed", "amount_collected", "outstanding"], barmode="group")
+
+
+@st.cache_resource(max_entries=8)
+def make_time_bar(time_team: pd.DataFrame) -> go.Figure:
+    # time_team is sorted by hours descending; keep the top 20 and plot largest at the top.
+    return px.bar(time_team.head(20).sort_values("hours"), x="hours", y="team", orientation="h")
+
+
+@st.cache_resource(max_entries=8)
+def make_profitability_scatter(profitability: pd.DataFrame) -> go.Figure:
+    return px.scatter(
+        profitability,
+        x="deal_value",
+        y="profit",
+        size="cost_to_deliver",
+        color="team",
+        hover_name="deal_name",
+    )
+
+
+data = load_all()
 deals = data["deals"]
 time_entries = data["time_entries"]
 invoices = data["invoices"]
 
-all_teams = sorted(set(deals.get("team", [])) | set(time_entries.get("team", [])))
+team_columns = [df["team"].astype("category") for df in (deals, time_entries) if "team" in df.columns]
+all_teams = union_categoricals(team_columns, sort_categories=True).categories.tolist() if team_columns else []
 
 st.sidebar.header("Team Targets")
 default_targets: dict[str, TeamTargets] = {}
-for team in all_teams:
-    with st.sidebar.expander(team, expanded=False):
-        revenue_target = st.number_input(f"{team} revenue target", min_value=0.0, value=250000.0, step=5000.0)
-        collection_target = st.number_input(f"{team} collection target", min_value=0.0, value=200000.0, step=5000.0)
-        utilization_target_hours = st.number_input(f"{team} utilization target hours", min_value=0.0, value=1800.0, step=50.0)
-        profitability_target_pct = st.number_input(f"{team} profitability target %", min_value=0.0, value=35.0, step=1.0)
-    default_targets[team] = TeamTargets(
-        revenue_target=revenue_target,
-        collection_target=collection_target,
-        utilization_target_hours=utilization_target_hours,
-        profitability_target_pct=profitability_target_pct,
-    )
+# Inputs inside a form only commit (and rerun the script) when "Apply targets" is pressed.
+with st.sidebar.form("targets"):
+    for team in all_teams:
+        with st.expander(team, expanded=False):
+            revenue_target = st.number_input(f"{team} revenue target", min_value=0.0, value=250000.0, step=5000.0)
+            collection_target = st.number_input(f"{team} collection target", min_value=0.0, value=200000.0, step=5000.0)
+            utilization_target_hours = st.number_input(f"{team} utilization target hours", min_value=0.0, value=1800.0, step=50.0)
+            profitability_target_pct = st.number_input(f"{team} profitability target %", min_value=0.0, value=35.0, step=1.0)
+        default_targets[team] = TeamTargets(
+            revenue_target=revenue_target,
+            collection_target=collection_target,
+            utilization_target_hours=utilization_target_hours,
+            profitability_target_pct=profitability_target_pct,
+        )
+    st.form_submit_button("Apply targets")
 
-billing_month = monthly_billing(invoices)
-billing_year = yearly_billing(invoices)
-time_team = time_recorded_per_team(time_entries)
-profitability = deal_profitability(deals)
-scorecard = team_scorecard(deals, time_entries, invoices, default_targets)
+billing_month, billing_year, time_team, profitability = build_reports(deals, time_entries, invoices)
+target_values = tuple(
+    (team, t.revenue_target, t.collection_target, t.utilization_target_hours, t.profitability_target_pct)
+    for team, t in sorted(default_targets.items())
+)
+scorecard = build_scorecard(deals, time_entries, invoices, target_values)
 
+# Summed over raw rows: the report frames drop undated invoices and entries without a team.
+totals = {
+    "billed": invoices["total"].sum(),
+    "collected": invoices["amount_paid"].sum(),
+    "hours": time_entries["hours"].sum(),
+    "margin": profitability["profit_margin_pct"].mean(),
+}
 col1, col2, col3, col4 = st.columns(4)
-col1.metric("Total billed", f"${invoices['total'].sum():,.0f}")
-col2.metric("Money collected", f"${invoices['amount_paid'].sum():,.0f}")
-col3.metric("Total hours recorded", f"{time_entries['hours'].sum():,.0f}h")
-col4.metric("Average deal margin", f"{profitability['profit_margin_pct'].mean():.1f}%")
+col1.metric("Total billed", f"${totals['billed']:,.0f}")
+col2.metric("Money collected", f"${totals['collected']:,.0f}")
+col3.metric("Total hours recorded", f"{totals['hours']:,.0f}h")
+col4.metric("Average deal margin", f"{totals['margin']:.1f}%")
 
 st.subheader("Billing: Monthly vs Yearly")
 a, b = st.columns(2)
-a.plotly_chart(px.bar(billing_month, x="month", y=["total_billed", "amount_collected", "outstanding"], barmode="group"), use_container_width=True)
-b.plotly_chart(px.bar(billing_year, x="year", y=["total_billed", "amount_collected", "outstanding"], barmode="group"), use_container_width=True)
+a.plotly_chart(make_billing_bar(billing_month, "month"), use_container_width=True)
+b.plotly_chart(make_billing_bar(billing_year, "year"), use_container_width=True)
 
 st.subheader("Time Recorded per Team")
-st.plotly_chart(px.pie(time_team, names="team", values="hours", hole=0.4), use_container_width=True)
+st.plotly_chart(make_time_bar(time_team), use_container_width=True)
 
 st.subheader("Deal Profitability")
-st.plotly_chart(px.scatter(
-    profitability,
-    x="deal_value",
-    y="profit",
-    size="cost_to_deliver",
-    color="team",
-    hover_name="deal_name",
-), use_container_width=True)
+st.plotly_chart(make_profitability_scatter(profitability), use_container_width=True)
 
 st.subheader("Auto-generated Team Scorecard")
 st.dataframe(scorecard, use_container_width=True)
 
 if st.checkbox("Show raw data tables"):
-    st.write("Deals", deals.head(100))
-    st.write("Time Entries", time_entries.head(100))
-    st.write("Invoices", invoices.head(100))
+    for label, frame in (("Deals", deals), ("Time Entries", time_entries), ("Invoices", invoices)):
+        st.caption(label)
+        st.dataframe(frame, use_container_width=True, height=300)
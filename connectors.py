@@ -1,13 +1,72 @@
 from __future__ import annotations
 
 import os
+import tempfile
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+XERO_PAGE_SIZE = 100
+MAX_PAGE_WORKERS = 4
+CATEGORICAL_COLUMNS = ("team", "client", "status", "contact", "project")
+# Currency stays float64: float32 keeps only ~7 significant digits, so totals would drift by dollars.
+MEASURE_DTYPES = {
+    "deal_value": "float64",
+    "cost_to_deliver": "float64",
+    "billable_amount": "float64",
+    "total": "float64",
+    "amount_paid": "float64",
+    "amount_due": "float64",
+    "hours": "float32",
+}
+DEMO_SEED = 7
+DEMO_CACHE_VERSION = 1
+DEMO_CACHE_DIR = Path(tempfile.gettempdir()) / "dashboard-demo-cache"
+DEMO_TEAMS = ["Growth", "Delivery", "Operations", "Customer Success"]
+DEMO_CLIENTS = ["Acme", "Globex", "Initech", "Umbrella", "Stark"]
+
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store low-cardinality label columns as categoricals and hours as float32."""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col, dtype in MEASURE_DTYPES.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+    return df
+
+
+def _demo_dates() -> pd.DatetimeIndex:
+    return pd.date_range(end=datetime.utcnow().date(), periods=365, freq="D")
+
+
+class LazyFrames(Mapping[str, pd.DataFrame]):
+    """Read-only mapping that builds each DataFrame on first access."""
+
+    def __init__(self, factories: dict[str, Callable[[], pd.DataFrame]]) -> None:
+        self._factories = factories
+        self._frames: dict[str, pd.DataFrame] = {}
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self._frames:
+            self._frames[name] = self._factories[name]()
+        return self._frames[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
 
 
 @dataclass
@@ -22,18 +81,24 @@ class ConnectorConfig:
 class DataConnector:
     def __init__(self, config: ConnectorConfig | None = None) -> None:
         self.config = config or ConnectorConfig()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
 
-    def load_data(self) -> dict[str, pd.DataFrame]:
+    def load_data(self) -> Mapping[str, pd.DataFrame]:
         """Load data from configured sources. Falls back to generated demo data."""
         if not all([self.config.monday_token, self.config.harvest_token, self.config.xero_token]):
             return self._demo_data()
 
+        loaders = {
+            "deals": self._load_monday_deals,
+            "time_entries": self._load_harvest_time,
+            "invoices": self._load_xero_invoices,
+        }
         try:
-            return {
-                "deals": self._load_monday_deals(),
-                "time_entries": self._load_harvest_time(),
-                "invoices": self._load_xero_invoices(),
-            }
+            with ThreadPoolExecutor(max_workers=len(loaders)) as ex:
+                futures = {name: ex.submit(fn) for name, fn in loaders.items()}
+                return {name: fut.result() for name, fut in futures.items()}
         except Exception:
             return self._demo_data()
 
@@ -53,7 +118,7 @@ class DataConnector:
           }
         }
         """
-        resp = requests.post(
+        resp = self._session.post(
             "https://api.monday.com/v2",
             json={"query": query},
             headers={"Authorization": self.config.monday_token or ""},
@@ -62,13 +127,11 @@ class DataConnector:
         resp.raise_for_status()
         data = resp.json()
         items = data["data"]["boards"][0]["items_page"]["items"]
-        rows: list[dict[str, Any]] = []
-        for it in items:
-            mapped = {"deal_name": it["name"]}
-            for col in it["column_values"]:
-                mapped[col["id"]] = col.get("text")
-            rows.append(mapped)
-        df = pd.DataFrame(rows)
+        texts = [{col["id"]: col.get("text") for col in it["column_values"]} for it in items]
+        column_ids = dict.fromkeys(cid for mapped in texts for cid in mapped)
+        columns: dict[str, list[Any]] = {"deal_name": [it["name"] for it in items]}
+        columns.update({cid: [mapped.get(cid) for mapped in texts] for cid in column_ids})
+        df = pd.DataFrame(columns)
         if "deal_value" in df.columns:
             df["deal_value"] = pd.to_numeric(df["deal_value"], errors="coerce").fillna(0)
         if "cost_to_deliver" in df.columns:
@@ -77,7 +140,7 @@ class DataConnector:
             df["close_date"] = pd.to_datetime(df["close_date"], errors="coerce")
         if "team" not in df.columns:
             df["team"] = "Unknown"
-        return df
+        return _compact_dtypes(df)
 
     def _load_harvest_time(self) -> pd.DataFrame:
         headers = {
@@ -87,30 +150,34 @@ class DataConnector:
         }
         start = (datetime.utcnow() - timedelta(days=365)).date().isoformat()
         end = datetime.utcnow().date().isoformat()
-        resp = requests.get(
-            "https://api.harvestapp.com/v2/time_entries",
-            params={"from": start, "to": end, "per_page": 200},
-            headers=headers,
-            timeout=20,
-        )
-        resp.raise_for_status()
-        entries = resp.json().get("time_entries", [])
-        rows = []
-        for e in entries:
-            rows.append(
-                {
-                    "date": e.get("spent_date"),
-                    "team": (e.get("user") or {}).get("name", "Unknown"),
-                    "project": (e.get("project") or {}).get("name", "Unknown"),
-                    "client": (e.get("client") or {}).get("name", "Unknown"),
-                    "hours": e.get("hours", 0),
-                    "billable": e.get("billable", False),
-                    "billable_amount": e.get("billable_rate", 0) * e.get("hours", 0),
-                }
+
+        def fetch_page(page: int) -> dict[str, Any]:
+            resp = self._session.get(
+                "https://api.harvestapp.com/v2/time_entries",
+                params={"from": start, "to": end, "per_page": 200, "page": page},
+                headers=headers,
+                timeout=20,
             )
-        df = pd.DataFrame(rows)
+            resp.raise_for_status()
+            return resp.json()
+
+        first = fetch_page(1)
+        entries = list(first.get("time_entries", []))
+        for payload in self._fetch_remaining_pages(fetch_page, first.get("total_pages") or 1):
+            entries.extend(payload.get("time_entries", []))
+        df = pd.DataFrame(
+            {
+                "date": [e.get("spent_date") for e in entries],
+                "team": [(e.get("user") or {}).get("name", "Unknown") for e in entries],
+                "project": [(e.get("project") or {}).get("name", "Unknown") for e in entries],
+                "client": [(e.get("client") or {}).get("name", "Unknown") for e in entries],
+                "hours": [e.get("hours", 0) for e in entries],
+                "billable": [e.get("billable", False) for e in entries],
+                "billable_amount": [e.get("billable_rate", 0) * e.get("hours", 0) for e in entries],
+            }
+        )
         df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        return df
+        return _compact_dtypes(df)
 
     def _load_xero_invoices(self) -> pd.DataFrame:
         headers = {
@@ -118,64 +185,119 @@ class DataConnector:
             "Xero-tenant-id": self.config.xero_tenant_id or "",
             "Accept": "application/json",
         }
-        resp = requests.get(
-            "https://api.xero.com/api.xro/2.0/Invoices",
-            headers=headers,
-            timeout=20,
-        )
-        resp.raise_for_status()
-        invoices = resp.json().get("Invoices", [])
-        rows = []
-        for inv in invoices:
-            rows.append(
-                {
-                    "invoice_number": inv.get("InvoiceNumber"),
-                    "contact": (inv.get("Contact") or {}).get("Name", "Unknown"),
-                    "status": inv.get("Status", "Unknown"),
-                    "date": inv.get("DateString"),
-                    "due_date": inv.get("DueDateString"),
-                    "amount_due": inv.get("AmountDue", 0),
-                    "amount_paid": inv.get("AmountPaid", 0),
-                    "total": inv.get("Total", 0),
-                }
+
+        def fetch_page(page: int) -> dict[str, Any]:
+            resp = self._session.get(
+                "https://api.xero.com/api.xro/2.0/Invoices",
+                params={"page": page},
+                headers=headers,
+                timeout=20,
             )
-        df = pd.DataFrame(rows)
+            resp.raise_for_status()
+            return resp.json()
+
+        first = fetch_page(1)
+        invoices = list(first.get("Invoices", []))
+        page_count = (first.get("pagination") or {}).get("pageCount")
+        if page_count is not None:
+            for payload in self._fetch_remaining_pages(fetch_page, page_count):
+                invoices.extend(payload.get("Invoices", []))
+        else:
+            # Older responses carry no pagination block; walk pages until a short one.
+            page, batch = 1, invoices
+            while len(batch) >= XERO_PAGE_SIZE:
+                page += 1
+                batch = fetch_page(page).get("Invoices", [])
+                invoices.extend(batch)
+        df = pd.DataFrame(
+            {
+                "invoice_number": [inv.get("InvoiceNumber") for inv in invoices],
+                "contact": [(inv.get("Contact") or {}).get("Name", "Unknown") for inv in invoices],
+                "status": [inv.get("Status", "Unknown") for inv in invoices],
+                "date": [inv.get("DateString") for inv in invoices],
+                "due_date": [inv.get("DueDateString") for inv in invoices],
+                "amount_due": [inv.get("AmountDue", 0) for inv in invoices],
+                "amount_paid": [inv.get("AmountPaid", 0) for inv in invoices],
+                "total": [inv.get("Total", 0) for inv in invoices],
+            }
+        )
         df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        return df
+        return _compact_dtypes(df)
+
+    def _fetch_remaining_pages(
+        self, fetch_page: Callable[[int], dict[str, Any]], total_pages: int
+    ) -> list[dict[str, Any]]:
+        """Fetch pages 2..total_pages concurrently, preserving page order."""
+        if total_pages <= 1:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, total_pages - 1)) as ex:
+            return list(ex.map(fetch_page, range(2, total_pages + 1)))
+
+    def _demo_data(self) -> LazyFrames:
+        return LazyFrames(
+            {
+                "deals": partial(self._demo_frame, "deals", self._demo_deals),
+                "time_entries": partial(self._demo_frame, "time_entries", self._demo_time_entries),
+                "invoices": partial(self._demo_frame, "invoices", self._demo_invoices),
+            }
+        )
 
-    def _demo_data(self) -> dict[str, pd.DataFrame]:
-        rng = np.random.default_rng(7)
-        dates = pd.date_range(end=datetime.utcnow().date(), periods=365, freq="D")
-        teams = ["Growth", "Delivery", "Operations", "Customer Success"]
-        clients = ["Acme", "Globex", "Initech", "Umbrella", "Stark"]
+    def _demo_frame(self, name: str, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Read a demo frame from the Parquet cache, generating and storing it on a miss."""
+        # Demo dates end today; bump DEMO_CACHE_VERSION whenever a generator's output changes.
+        key = f"{name}-v{DEMO_CACHE_VERSION}-seed{DEMO_SEED}-{datetime.utcnow().date().isoformat()}"
+        path = DEMO_CACHE_DIR / f"{key}.parquet"
+        if path.exists():
+            try:
+                return pd.read_parquet(path)
+            except (ImportError, OSError, ValueError):  # no Parquet engine, or a corrupt/partial file
+                path.unlink(missing_ok=True)
+        df = build()
+        try:
+            DEMO_CACHE_DIR.mkdir(exist_ok=True)
+            df.to_parquet(path)
+        except (ImportError, OSError):
+            path.unlink(missing_ok=True)  # the cache is best-effort; the generated frame is still valid
+        return df
 
+    def _demo_deals(self) -> pd.DataFrame:
+        rng = np.random.default_rng([DEMO_SEED, 0])
+        dates = _demo_dates()
         deals = pd.DataFrame(
             {
                 "deal_name": [f"Deal-{i}" for i in range(1, 101)],
-                "team": rng.choice(teams, 100),
+                "team": rng.choice(DEMO_TEAMS, 100),
                 "close_date": rng.choice(dates, 100),
                 "deal_value": rng.integers(8000, 120000, 100),
                 "cost_to_deliver": rng.integers(3000, 70000, 100),
             }
         )
+        return _compact_dtypes(deals)
 
+    def _demo_time_entries(self) -> pd.DataFrame:
+        rng = np.random.default_rng([DEMO_SEED, 1])
+        dates = _demo_dates()
         time_entries = pd.DataFrame(
             {
                 "date": rng.choice(dates, 2000),
-                "team": rng.choice(teams, 2000),
+                "team": rng.choice(DEMO_TEAMS, 2000),
                 "project": [f"Project-{i%40}" for i in range(2000)],
-                "client": rng.choice(clients, 2000),
+                "client": rng.choice(DEMO_CLIENTS, 2000),
                 "hours": rng.uniform(0.5, 8.0, 2000).round(2),
                 "billable": rng.choice([True, False], 2000, p=[0.8, 0.2]),
             }
         )
         time_entries["billable_amount"] = (time_entries["hours"] * rng.uniform(80, 220, 2000)).round(2)
+        return _compact_dtypes(time_entries)
 
+    def _demo_invoices(self) -> pd.DataFrame:
+        rng = np.random.default_rng([DEMO_SEED, 2])
+        dates = _demo_dates()
         invoice_dates = pd.DataFrame({"date": rng.choice(dates, 300)})
         invoices = pd.DataFrame(
             {
                 "invoice_number": [f"INV-{1000+i}" for i in range(300)],
-                "contact": rng.choice(clients, 300),
+                "contact": rng.choice(DEMO_CLIENTS, 300),
                 "status": rng.choice(["PAID", "AUTHORISED", "SUBMITTED"], 300, p=[0.7, 0.2, 0.1]),
                 "date": invoice_dates["date"],
                 "due_date": invoice_dates["date"] + pd.to_timedelta(30, unit="D"),
@@ -185,4 +307,4 @@ class DataConnector:
         paid_ratio = rng.uniform(0.65, 1.0, 300)
         invoices["amount_paid"] = (invoices["total"] * paid_ratio).round(2)
         invoices["amount_due"] = (invoices["total"] - invoices["amount_paid"]).round(2)
-        return {"deals": deals, "time_entries": time_entries, "invoices": invoices}
+        return _compact_dtypes(invoices)
@@ -2,8 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; scorecards fall back to plain numpy
+    njit = None
+
+# Below this many teams the numpy path beats numba's call overhead.
+NUMBA_MIN_TEAMS = 32
+
 
 @dataclass
 class TeamTargets:
@@ -13,39 +22,110 @@ class TeamTargets:
     profitability_target_pct: float
 
 
+def _pct(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator * 100, with 0 wherever the denominator is 0."""
+    return np.where(denominator == 0, 0.0, numerator / np.where(denominator == 0, 1, denominator) * 100)
+
+
 def monthly_billing(invoices: pd.DataFrame) -> pd.DataFrame:
-    df = invoices.copy()
-    df["month"] = pd.to_datetime(df["date"], errors="coerce").dt.to_period("M").astype(str)
+    months = invoices["date"].dt.to_period("M").astype(str).rename("month")
     return (
-        df.groupby("month", as_index=False)
+        invoices.groupby(months)
         .agg(total_billed=("total", "sum"), amount_collected=("amount_paid", "sum"), outstanding=("amount_due", "sum"))
+        .reset_index()
         .sort_values("month")
     )
 
 
 def yearly_billing(invoices: pd.DataFrame) -> pd.DataFrame:
-    df = invoices.copy()
-    df["year"] = pd.to_datetime(df["date"], errors="coerce").dt.year
+    years = invoices["date"].dt.year.rename("year")
     return (
-        df.groupby("year", as_index=False)
+        invoices.groupby(years)
         .agg(total_billed=("total", "sum"), amount_collected=("amount_paid", "sum"), outstanding=("amount_due", "sum"))
+        .reset_index()
         .sort_values("year")
     )
 
 
 def time_recorded_per_team(time_entries: pd.DataFrame) -> pd.DataFrame:
     return (
-        time_entries.groupby("team", as_index=False)
+        time_entries.groupby("team", as_index=False, observed=True)
         .agg(hours=("hours", "sum"), billable_amount=("billable_amount", "sum"))
         .sort_values("hours", ascending=False)
     )
 
 
 def deal_profitability(deals: pd.DataFrame) -> pd.DataFrame:
-    df = deals.copy()
-    df["profit"] = df["deal_value"] - df["cost_to_deliver"]
-    df["profit_margin_pct"] = (df["profit"] / df["deal_value"]).replace([pd.NA, pd.NaT], 0).fillna(0) * 100
-    return df.sort_values("profit", ascending=False)
+    return deals.assign(
+        profit=lambda d: d["deal_value"] - d["cost_to_deliver"],
+        profit_margin_pct=lambda d: _pct(d["profit"].to_numpy(), d["deal_value"].to_numpy()),
+    ).sort_values("profit", ascending=False)
+
+
+def _team_agg(deals: pd.DataFrame) -> pd.DataFrame:
+    """Per-team revenue, profit and profitability without materialising per-deal profit."""
+    df = deals.groupby("team", sort=False, observed=True).agg(
+        revenue=("deal_value", "sum"),
+        cost=("cost_to_deliver", "sum"),
+    )
+    df["profit"] = df["revenue"] - df["cost"]
+    df["profitability_pct"] = _pct(df["profit"].to_numpy(), df["revenue"].to_numpy())
+    return df.drop(columns="cost")
+
+
+def _score_numpy(
+    revenue: np.ndarray,
+    hours: np.ndarray,
+    profitability_pct: np.ndarray,
+    revenue_target: np.ndarray,
+    collection_target: np.ndarray,
+    utilization_target: np.ndarray,
+    profitability_target: np.ndarray,
+    total_collected: float,
+    total_revenue: float,
+) -> np.ndarray:
+    """Collected estimate and the four vs-target percentages, one row per output column."""
+    collected = total_collected * revenue / total_revenue if total_revenue else np.zeros(len(revenue))
+    return np.stack(
+        [
+            collected,
+            _pct(revenue, revenue_target),
+            _pct(collected, collection_target),
+            _pct(hours, utilization_target),
+            _pct(profitability_pct, profitability_target),
+        ]
+    )
+
+
+def _score_loop(
+    revenue: np.ndarray,
+    hours: np.ndarray,
+    profitability_pct: np.ndarray,
+    revenue_target: np.ndarray,
+    collection_target: np.ndarray,
+    utilization_target: np.ndarray,
+    profitability_target: np.ndarray,
+    total_collected: float,
+    total_revenue: float,
+) -> np.ndarray:
+    """Single fused pass equivalent to _score_numpy; compiled with numba when available."""
+    n = len(revenue)
+    out = np.zeros((5, n))
+    for i in range(n):
+        collected = total_collected * revenue[i] / total_revenue if total_revenue != 0 else 0.0
+        out[0, i] = collected
+        if revenue_target[i] != 0:
+            out[1, i] = revenue[i] / revenue_target[i] * 100
+        if collection_target[i] != 0:
+            out[2, i] = collected / collection_target[i] * 100
+        if utilization_target[i] != 0:
+            out[3, i] = hours[i] / utilization_target[i] * 100
+        if profitability_target[i] != 0:
+            out[4, i] = profitability_pct[i] / profitability_target[i] * 100
+    return out
+
+
+_score_jit = njit(cache=True)(_score_loop) if njit is not None else None
 
 
 def team_scorecard(
@@ -54,46 +134,44 @@ def team_scorecard(
     invoices: pd.DataFrame,
     targets: dict[str, TeamTargets],
 ) -> pd.DataFrame:
-    profitability = deal_profitability(deals)
-    by_team_profit = profitability.groupby("team", as_index=False).agg(
-        revenue=("deal_value", "sum"),
-        profit=("profit", "sum"),
-    )
-    by_team_profit["profitability_pct"] = (by_team_profit["profit"] / by_team_profit["revenue"]).fillna(0) * 100
-
-    time_team = time_recorded_per_team(time_entries)
+    by_team_profit = _team_agg(deals)
+    time_team = time_entries.groupby("team", sort=False, observed=True).agg(hours=("hours", "sum"))
 
-    merged = by_team_profit.merge(time_team, on="team", how="outer").fillna(0)
+    merged = by_team_profit.join(time_team, how="outer").fillna(0).reset_index()
     total_collected = float(invoices["amount_paid"].sum())
+    total_revenue = float(merged["revenue"].sum())
+
+    revenue = merged["revenue"].to_numpy(dtype=float)
+    profit = merged["profit"].to_numpy(dtype=float)
+    hours = merged["hours"].to_numpy(dtype=float)
+    profitability_pct = merged["profitability_pct"].to_numpy(dtype=float)
+
+    def _target(field: str) -> np.ndarray:
+        mapping = {team: getattr(t, field) for team, t in targets.items()}
+        return merged["team"].map(mapping).astype(float).fillna(0).to_numpy()
+
+    target_arrays = (
+        _target("revenue_target"),
+        _target("collection_target"),
+        _target("utilization_target_hours"),
+        _target("profitability_target_pct"),
+    )
+    score = _score_jit if _score_jit is not None and len(merged) >= NUMBA_MIN_TEAMS else _score_numpy
+    collected_team, revenue_pct, collection_pct, utilization_pct, profitability_vs_pct = score(
+        revenue, hours, profitability_pct, *target_arrays, total_collected, total_revenue
+    )
 
-    rows = []
-    for _, row in merged.iterrows():
-        team = row["team"]
-        t = targets.get(
-            team,
-            TeamTargets(revenue_target=0, collection_target=0, utilization_target_hours=0, profitability_target_pct=0),
-        )
-        revenue = float(row["revenue"])
-        profit = float(row["profit"])
-        hours = float(row["hours"])
-        profitability_pct = float(row["profitability_pct"])
-        collection_share = 0 if merged["revenue"].sum() == 0 else revenue / merged["revenue"].sum()
-        collected_team = total_collected * collection_share
-
-        rows.append(
-            {
-                "team": team,
-                "revenue": revenue,
-                "profit": profit,
-                "profitability_pct": profitability_pct,
-                "hours": hours,
-                "collected_estimate": collected_team,
-                "revenue_vs_target_pct": 0 if t.revenue_target == 0 else revenue / t.revenue_target * 100,
-                "collection_vs_target_pct": 0 if t.collection_target == 0 else collected_team / t.collection_target * 100,
-                "utilization_vs_target_pct": 0 if t.utilization_target_hours == 0 else hours / t.utilization_target_hours * 100,
-                "profitability_vs_target_pct": 0
-                if t.profitability_target_pct == 0
-                else profitability_pct / t.profitability_target_pct * 100,
-            }
-        )
-    return pd.DataFrame(rows).sort_values("revenue", ascending=False)
+    return pd.DataFrame(
+        {
+            "team": merged["team"].to_numpy(),
+            "revenue": revenue,
+            "profit": profit,
+            "profitability_pct": profitability_pct,
+            "hours": hours,
+            "collected_estimate": collected_team,
+            "revenue_vs_target_pct": revenue_pct,
+            "collection_vs_target_pct": collection_pct,
+            "utilization_vs_target_pct": utilization_pct,
+            "profitability_vs_target_pct": profitability_vs_pct,
+        }
+    ).sort_values("revenue", ascending=False)